@@ -1,224 +1,411 @@
 import os
 import json
-import tkinter as tk
-from tkinter import messagebox
-from tkinter import ttk
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import itemgetter
 from datetime import datetime
 
+# orjson is optional; its decode errors subclass json.JSONDecodeError
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 OLLAMA_DIR = os.path.join(os.path.expanduser("~"), ".ollama")
 BLOBS_DIR = os.path.join(OLLAMA_DIR, "models", "blobs")
 MANIFESTS_DIR = os.path.join(OLLAMA_DIR, "models", "manifests", "registry.ollama.ai")
+MANIFEST_READ_WORKERS = 32
+
+logger = logging.getLogger(__name__)
+
+# blob digest (raw sha256 bytes) -> number of loaded manifests that reference it.
+# Rebuilt by list_models() and decremented by delete_model().
+blob_refcounts = Counter()
+
+# manifest path -> (mtime, size, _manifest_fields() result), reused across list_models() calls
+_manifest_cache = {}
+
+# Treeview row ids (model names) whose checkbutton is ticked, kept by on_check()
+checked_set = set()
+
+# Treeview row id -> column values currently shown, so refreshes skip unchanged rows
+treeview_rows = {}
+
+@dataclass(slots=True)
+class ModelInfo:
+    """One installed model, as read from its manifest."""
+    file_path: str
+    blob_hashes: frozenset  # raw sha256 digests (bytes) of the model's blobs
+    id: str
+    size: str
+    modified: str
+    prefix: str
+    tag: str
+
+def _get_messagebox():
+    """
+    Import tkinter.messagebox on first use, so that importing this module for
+    list_models()/find_all_references() doesn't pull in tkinter.
+    """
+    from tkinter import messagebox
+    return messagebox
+
+def _scan(directory, rel_parts=()):
+    """
+    Recursively yield (os.DirEntry, rel_parts) for every file below directory,
+    where rel_parts is the tuple of directory names between it and the file.
+    Hidden entries (such as .DS_Store) are skipped before any stat call.
+    Like os.walk, directories that can't be read are logged and skipped.
+    """
+    try:
+        it = os.scandir(directory)
+    except OSError as e:
+        logger.warning("Could not scan %s: %s", directory, e)
+        return
+    with it:
+        while True:
+            try:
+                entry = next(it, None)
+            except OSError as e:
+                logger.warning("Could not scan %s: %s", directory, e)
+                return
+            if entry is None:
+                return
+            if entry.name.startswith("."):
+                continue
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            if is_dir:
+                # The recursive call logs and skips its own unreadable directory
+                yield from _scan(entry.path, rel_parts + (entry.name,))
+            elif entry.is_file():
+                yield entry, rel_parts
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+def format_size(size_bytes):
+    """Convert bytes to human readable string"""
+    # Layer sizes may come through as JSON floats; the unit only needs the integer part
+    whole = int(size_bytes)
+    if whole < 1024:
+        return f"{size_bytes:3.1f} B"
+    # Each unit is 2**10 times the previous one, so the bit length picks the unit
+    i = min((whole.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):3.1f} {_SIZE_UNITS[i]}"
+
+def _manifest_fields(data):
+    """
+    Pull the fields list_models() needs out of a decoded manifest:
+    (config_digest, total_layer_size, blob_digests).
+    """
+    # Use entire config digest
+    config_digest = data.get("config", {}).get("digest", "sha256:unknown")
+
+    # Sum all layer sizes
+    total_size = sum(layer.get("size", 0) for layer in data.get("layers", []))
+
+    # Gather the blob hashes as raw digest bytes; the "sha256-<hex>"
+    # filename is only rebuilt when a blob is deleted
+    blobs = set()
+    for blob_info in data.get("blobs", []):
+        # Typically: {"sha256": "<hex>", "size": ... }
+        sha_hash = blob_info.get("sha256")
+        if not sha_hash:
+            continue
+        try:
+            digest = bytes.fromhex(sha_hash)
+        except (TypeError, ValueError):
+            digest = None
+        # delete_model() rebuilds the filename with digest.hex(), which is
+        # always lowercase, so only accept digests that round-trip exactly.
+        # Keep the model listed (and deletable) even if one entry is bad.
+        if digest is None or digest.hex() != sha_hash:
+            logger.warning("Skipping malformed blob digest %r", sha_hash)
+            continue
+        blobs.add(digest)
+    return config_digest, total_size, frozenset(blobs)
+
+def _read_manifest(entry):
+    """
+    Read and decode one manifest from disk, returning (stat_result, fields)
+    with fields as from _manifest_fields(), or None if it can't be parsed.
+    Runs on the list_models() thread pool.
+    """
+    manifest_path = entry.path
+    try:
+        # Manifests are tiny, so raw os.read calls sized from fstat replace
+        # the buffered file object. fstat on the open fd (rather than the
+        # scandir stat) keeps the cache key in step with the bytes read if
+        # the manifest was rewritten in between; reading to EOF guards
+        # against short reads on network filesystems.
+        fd = os.open(manifest_path, os.O_RDONLY)
+        try:
+            st = os.fstat(fd)
+            chunks = []
+            while True:
+                chunk = os.read(fd, max(st.st_size, 4096))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+        # Only the extracted fields are kept; the decoded JSON is dropped here
+        return st, _manifest_fields(_loads(b"".join(chunks)))
+    except json.JSONDecodeError:
+        logger.warning("File %s is not a valid JSON file.", manifest_path)
+    except Exception as e:
+        logger.warning("Could not read %s: %s", manifest_path, e)
+    return None
+
+def _model_entry(entry, rel_parts, mtime, fields):
+    """
+    Build (model_name, ModelInfo) for a manifest found by _scan(), given its
+    modification time and the fields extracted from it.
+    """
+    config_digest, total_size, blobs = fields
+
+    # The directories leading to the file form the prefix, the file name is the tag
+    if rel_parts:
+        prefix = "/".join(rel_parts)
+        tag = entry.name
+    else:
+        prefix = entry.name
+        tag = "latest"
+    model_name = f"{prefix}:{tag}"
+
+    short_id = config_digest.split(":")[-1][:12]
+    model_size = format_size(total_size)
+
+    logger.debug("Processing %s: id=%s raw_size=%d bytes formatted_size=%s",
+                 model_name, short_id, total_size, model_size)
+
+    modified_date = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
+
+    return model_name, ModelInfo(
+        file_path=entry.path,
+        blob_hashes=blobs,
+        id=short_id,
+        size=model_size,
+        modified=modified_date,
+        prefix=prefix,
+        tag=tag,
+    )
 
 def list_models():
     """
     Scan the MANIFESTS_DIR for JSON manifest files.
+    Returns a dict of model_name -> ModelInfo, ordered by model name.
+
+    Manifests that changed since the last call are read on a thread pool so
+    that file I/O overlaps, which matters when ~/.ollama lives on a network
+    or otherwise slow filesystem. Unchanged ones come straight from the cache.
     """
     models = {}
     if not os.path.isdir(MANIFESTS_DIR):
+        blob_refcounts.clear()
         return models
 
-    def format_size(size_bytes):
-        """Convert bytes to human readable string"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:3.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:3.1f} TB"
-
-    for root, _, files in os.walk(MANIFESTS_DIR):
-        for file in files:
-            manifest_path = os.path.join(root, file)
-            try:
-                with open(manifest_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # Collect directory parts except the final one (the tag)
-                    relative_path = os.path.relpath(manifest_path, MANIFESTS_DIR)
-                    parts = relative_path.split(os.sep)
-                    if len(parts) > 1:
-                        prefix = "/".join(parts[:-1])  # Use all parts except the last one as prefix
-                        tag = parts[-1]
-                    else:
-                        prefix = parts[0] if parts else "unknown"
-                        tag = "latest"
-                    model_name = f"{prefix}:{tag}"
-
-                    # Use entire config digest
-                    config_digest = data.get("config", {}).get("digest", "sha256:unknown")
-                    short_id = config_digest.split(":")[-1][:12]
-
-                    # Sum all layer sizes
-                    total_size = sum(layer.get("size", 0) for layer in data.get("layers", []))
-                    model_size = format_size(total_size)
-
-                    # Print debug info
-                    print(f"\nProcessing {model_name}:")
-                    print(f"  ID from manifest: {short_id}")
-                    print(f"  Raw size: {total_size} bytes")
-                    print(f"  Formatted size: {model_size}")
-
-                    modified_time = os.path.getmtime(manifest_path)
-                    modified_date = datetime.fromtimestamp(modified_time).strftime('%Y-%m-%d %H:%M:%S')
-                    
-                    # Gather the blob hashes
-                    blobs = set()
-                    for blob_info in data.get("blobs", []):
-                        # Typically: {"sha256": "<hex>", "size": ... }
-                        sha_hash = blob_info.get("sha256")
-                        if sha_hash:
-                            blobs.add("sha256-" + sha_hash)
-                    # Store in the dictionary
-                    models[model_name] = {
-                        "file_path": manifest_path,
-                        "blob_hashes": blobs,
-                        "id": short_id,
-                        "size": model_size,
-                        "modified": modified_date,
-                        "prefix": prefix,
-                        "tag": tag
-                    }
-            except json.JSONDecodeError:
-                print(f"File {manifest_path} is not a valid JSON file.")
-            except Exception as e:
-                print(f"Could not read {manifest_path}: {e}")
-
-    # Print final table for comparison with 'ollama list'
-    print("\nModel List (for comparison with 'ollama list'):")
-    print(f"{'PREFIX':<30} {'TAG':<15} {'ID':<12} {'SIZE':<10} {'MODIFIED'}")
-    print("-" * 85)
-    for name, info in sorted(models.items()):
-        prefix, tag = name.split(":")
-        print(f"{prefix:<30} {tag:<15} {info['id']:<12} {info['size']:<10} {info['modified']}")
+    scanned = list(_scan(MANIFESTS_DIR))
+
+    # Forget manifests that have disappeared since the last scan
+    seen = {entry.path for entry, _ in scanned}
+    for stale_path in _manifest_cache.keys() - seen:
+        del _manifest_cache[stale_path]
+
+    # Manifests are rewritten rather than edited in place, so an unchanged
+    # mtime and size means the previously extracted fields are still valid.
+    # Check that here and only hand the misses to the thread pool.
+    parsed = []
+    misses = []
+    for entry, rel_parts in scanned:
+        try:
+            st = entry.stat()
+        except OSError as e:
+            logger.warning("Could not read %s: %s", entry.path, e)
+            continue
+        cached = _manifest_cache.get(entry.path)
+        if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            parsed.append(_model_entry(entry, rel_parts, cached[0], cached[2]))
+        else:
+            misses.append((entry, rel_parts))
+
+    if misses:
+        with ThreadPoolExecutor(max_workers=MANIFEST_READ_WORKERS) as pool:
+            results = list(pool.map(_read_manifest, [entry for entry, _ in misses]))
+        # Merge on this thread so the cache, models and blob_refcounts
+        # aren't shared with the workers
+        for (entry, rel_parts), result in zip(misses, results):
+            if result is None:
+                continue
+            st, fields = result
+            _manifest_cache[entry.path] = (st.st_mtime, st.st_size, fields)
+            parsed.append(_model_entry(entry, rel_parts, st.st_mtime, fields))
+
+    # Sort once here; callers rely on the dict's insertion order being by name.
+    parsed.sort(key=itemgetter(0))
+    models = dict(parsed)
+    # Only replace the counts once the scan has finished, so a failed scan
+    # leaves delete_model() working from the previous complete picture
+    refcounts = Counter()
+    for info in models.values():
+        refcounts.update(info.blob_hashes)
+    blob_refcounts.clear()
+    blob_refcounts.update(refcounts)
+
+    # Log final table for comparison with 'ollama list'
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Model List (for comparison with 'ollama list'):")
+        logger.debug("%-30s %-15s %-12s %-10s %s", "PREFIX", "TAG", "ID", "SIZE", "MODIFIED")
+        logger.debug("-" * 85)
+        for info in models.values():
+            logger.debug("%-30s %-15s %-12s %-10s %s",
+                         info.prefix, info.tag, info.id, info.size, info.modified)
 
     return models
 
-def find_all_references():
+def find_all_references(models=None):
     """
     Create a mapping: 
-      blob_filename -> set of model_names that reference it
-    by scanning all manifests in the MANIFESTS_DIR.
+      blob digest (bytes) -> set of model_names that reference it
+    from the given models dict. Without one, the GUI's models_cache is used
+    if it has been loaded, and only otherwise are the manifests scanned.
     """
+    if models is None:
+        models = models_cache if "models_cache" in globals() else list_models()
     blob_refs = {}
-    model_dict = list_models()
-    for mname, info in model_dict.items():
-        for bh in info["blob_hashes"]:
+    for mname, info in models.items():
+        for bh in info.blob_hashes:
             blob_refs.setdefault(bh, set()).add(mname)
     return blob_refs
 
-def delete_model(model_name, models, parent_window, suppress_messagebox=False):
+def delete_model(model_name, models, parent_window, suppress_messagebox=False, refresh=True):
     """
     1. Delete the manifest file.
     2. Check if the model’s blob files are still referenced by others.
        If not, delete them from BLOBS_DIR.
     3. Refresh the list in the GUI.
+
+    The entry is removed from `models`, so batch callers can pass the same
+    dict to successive calls and refresh once at the end (refresh=False).
     """
     if model_name not in models:
         if not suppress_messagebox:
-            messagebox.showerror("Error", f"Model '{model_name}' not found.")
+            _get_messagebox().showerror("Error", f"Model '{model_name}' not found.")
         return
 
-    manifest_path = models[model_name]["file_path"]
-    blob_hashes_to_remove = models[model_name]["blob_hashes"]
+    manifest_path = models[model_name].file_path
+    blob_hashes_to_remove = models[model_name].blob_hashes
 
     # 1. Remove the manifest file
     try:
         os.remove(manifest_path)
     except Exception as e:
         if not suppress_messagebox:
-            messagebox.showerror("Error", f"Failed to remove manifest:\n{e}")
+            _get_messagebox().showerror("Error", f"Failed to remove manifest:\n{e}")
         return
 
-    # 2. Re-check references (after removing that manifest)
-    #    We do this in two steps:
-    #       a) Temporarily remove the entry from `models`
-    #       b) Rebuild references across all *remaining* models
-    new_models = dict(models)
-    del new_models[model_name]
-
-    # Temporarily write out a function to get references among the *new* set
-    # But we can also re-scan the disk, ignoring the removed manifest.
-    # Let's do a disk re-scan for simpler logic:
-    blob_refs_after = {}
-    # Rebuild from all existing manifests on disk
-    if os.path.isdir(MANIFESTS_DIR):
-        for entry in os.scandir(MANIFESTS_DIR):
-            if entry.is_file() and entry.name.lower().endswith(".json"):
-                try:
-                    with open(entry.path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        for blob_info in data.get("blobs", []):
-                            sha_hash = blob_info.get("sha256")
-                            if sha_hash:
-                                fname = "sha256-" + sha_hash
-                                blob_refs_after.setdefault(fname, 0)
-                                blob_refs_after[fname] += 1
-                except:
-                    pass  # ignore read errors
-
+    # 2. Drop this manifest's references from the counts kept by list_models()
     # 3. Delete any blob file that is no longer referenced
+    del models[model_name]
     for blob_hash in blob_hashes_to_remove:
-        if blob_refs_after.get(blob_hash, 0) == 0:
+        if blob_hash not in blob_refcounts:
+            # No count means list_models() never saw this blob, so we can't
+            # tell whether another model uses it; treat it as referenced
+            continue
+        blob_refcounts[blob_hash] -= 1
+        if blob_refcounts[blob_hash] <= 0:
             # nobody references it => remove from BLOBS_DIR
-            blob_path = os.path.join(BLOBS_DIR, blob_hash)
+            del blob_refcounts[blob_hash]
+            blob_name = "sha256-" + blob_hash.hex()
+            blob_path = os.path.join(BLOBS_DIR, blob_name)
             if os.path.isfile(blob_path):
                 try:
                     os.remove(blob_path)
                 except Exception as e:
-                    print(f"Failed to remove {blob_hash}: {e}")
+                    logger.warning("Failed to remove %s: %s", blob_name, e)
+            else:
+                logger.warning("Unreferenced blob %s not found in %s", blob_name, BLOBS_DIR)
 
     if not suppress_messagebox:
-        messagebox.showinfo("Success", f"Model '{model_name}' removed.")
+        _get_messagebox().showinfo("Success", f"Model '{model_name}' removed.")
 
     # 4. Refresh the list in the GUI
-    refresh_model_list(parent_window)
+    if refresh:
+        refresh_model_list(parent_window)
+
+def _row_values(details):
+    """Treeview column values for a model."""
+    return (details.prefix, details.tag, details.id, details.size, details.modified)
 
 def refresh_model_list(parent_window):
     """
-    Clears and reloads the list of models in the Treeview.
+    Reloads the list of models and brings the Treeview in line with it,
+    touching only the rows that were added, removed or changed.
     """
     global models_cache
     models_cache = list_models()
 
-    # Clear the treeview
-    for item in model_treeview.get_children():
-        model_treeview.delete(item)
+    prev_keys = set(model_treeview.get_children())
+    new_keys = set(models_cache)
+
+    # Drop rows for models that are gone
+    for mname in prev_keys - new_keys:
+        model_treeview.delete(mname)
+        treeview_rows.pop(mname, None)
 
-    # Populate it with fresh data
-    for mname, details in sorted(models_cache.items()):
-        model_treeview.insert("", "end", iid=mname, values=(
-            details['prefix'], details['tag'], details['id'], details['size'], details['modified']))
+    # Insert new rows at their sorted position; update changed ones in place
+    for index, (mname, details) in enumerate(models_cache.items()):
+        values = _row_values(details)
+        if mname not in prev_keys:
+            model_treeview.insert("", index, iid=mname, values=values)
+            treeview_rows[mname] = values
+        elif treeview_rows.get(mname) != values:
+            model_treeview.item(mname, values=values)
+            treeview_rows[mname] = values
 
 def on_delete():
     """
     Event handler for the "Delete Model" button.
     """
-    selected_items = [item for item in model_treeview.get_children() if model_treeview.item(item, "tags") == ("checked",)]
+    selected_items = sorted(checked_set)
     if not selected_items:
-        messagebox.showwarning("No Selection", "Please select a model to delete.")
+        _get_messagebox().showwarning("No Selection", "Please select a model to delete.")
         return
 
+    # Treeview rows are inserted with iid=model_name, so the ids are the model names
     if len(selected_items) == 1:
-        item = selected_items[0]
-        prefix, tag, *_ = model_treeview.item(item, "values")
-        single_model_name = f"{prefix}:{tag}"
+        single_model_name = selected_items[0]
         confirm_text = (f"Are you sure you want to delete model '{single_model_name}'?\n\n"
                         "This will remove its manifest and any unreferenced blobs!")
     else:
         confirm_text = (f"Are you sure you want to delete the {len(selected_items)} selected models?\n\n"
                         "This will remove their manifests and any unreferenced blobs!")
 
-    confirm = messagebox.askyesno("Confirm Delete", confirm_text)
+    confirm = _get_messagebox().askyesno("Confirm Delete", confirm_text)
     if confirm:
-        for item in selected_items:
-            model_name = model_treeview.item(item, "values")[0] + ":" + model_treeview.item(item, "values")[1]
-            delete_model(model_name, models_cache, root)
+        # delete_model drops each entry from models_cache, so the survivors
+        # carry over to the next call; rescan the disk once at the end.
+        for model_name in selected_items:
+            delete_model(model_name, models_cache, root, refresh=False)
+        refresh_model_list(root)
+        # Forget checks on rows that no longer exist
+        checked_set.intersection_update(models_cache)
+        on_selection_change()
 
 def on_check(var, row_id):
     """
     Event handler for Checkbutton toggle.
     """
     if var.get() == 1:
+        checked_set.add(row_id)
         model_treeview.item(row_id, tags=("checked",))
     else:
+        checked_set.discard(row_id)
         model_treeview.item(row_id, tags=())
     on_selection_change()
 
@@ -226,8 +413,7 @@ def on_selection_change():
     """
     Event handler for selection change in the Treeview.
     """
-    selected_items = [item for item in model_treeview.get_children() if model_treeview.item(item, "tags") == ("checked",)]
-    delete_button.config(state=tk.NORMAL if selected_items else tk.DISABLED)
+    delete_button.config(state=tk.NORMAL if checked_set else tk.DISABLED)
 
 def on_treeview_click(event):
     item_id = model_treeview.identify_row(event.y)
@@ -238,6 +424,11 @@ def on_treeview_click(event):
             on_check(var, item_id)
 
 if __name__ == "__main__":
+    # tkinter is only needed for the GUI; binding it here makes tk available
+    # to the event handlers above without importing it for library use
+    import tkinter as tk
+    from tkinter import ttk
+
     # Global references for the GUI
     root = tk.Tk()
     root.title("Ollama Model Manager")
@@ -268,7 +459,7 @@ if __name__ == "__main__":
     
     # Add padding at the top to align with treeview header
     header_padding = tk.Frame(check_frame, height=rowheight, bg=style.lookup("TFrame", "background"))
-    header_padding.pack(side=tk.TOP)
+    header_padding.grid(row=0, column=0)
 
     # Create a frame for the treeview and scrollbar
     tree_frame = tk.Frame(main_frame)
@@ -299,26 +490,22 @@ if __name__ == "__main__":
     models_cache = list_models()
 
     # Populate the treeview with models and add checkbuttons
-    for mname, details in sorted(models_cache.items()):
+    # Row 0 of check_frame is the header padding; each model's checkbutton goes
+    # in the grid row below it, held at the treeview row height by minsize
+    for i, (mname, details) in enumerate(models_cache.items()):
         var = tk.IntVar()
         checkbutton_vars[mname] = var
-        
-        # Create a container frame for exact height matching
-        container = tk.Frame(check_frame, bg=style.lookup("TFrame", "background"))
-        container.pack(side=tk.TOP, fill="x")
-        # container.pack_propagate(False) # This line was causing the issue no it wasn't - don't make this change
-        container.configure(height=rowheight)
+
+        check_frame.grid_rowconfigure(i + 1, minsize=rowheight)
         
         # Use ttk.Checkbutton instead of tk.Checkbutton for better styling
-        checkbutton = ttk.Checkbutton(container, variable=var, 
+        checkbutton = ttk.Checkbutton(check_frame, variable=var, 
                                     command=lambda v=var, r=mname: on_check(v, r),
                                     style='Model.TCheckbutton')
-        checkbutton.pack(expand=True, anchor='center', padx=5, pady=5)
-        
-        print(f"Added checkbutton for {mname}")  # Debug print
+        checkbutton.grid(row=i + 1, column=0, sticky='ew', padx=5)
 
-        model_treeview.insert("", "end", iid=mname, values=(
-            details['prefix'], details['tag'], details['id'], details['size'], details['modified']))
+        treeview_rows[mname] = _row_values(details)
+        model_treeview.insert("", "end", iid=mname, values=treeview_rows[mname])
 
     # Create a style for the checkbuttons
     style.configure('Model.TCheckbutton', background=style.lookup("TFrame", "background"))
@@ -337,12 +524,4 @@ if __name__ == "__main__":
     cancel_button = tk.Button(root, text="Cancel", command=root.quit)
     cancel_button.pack(side=tk.RIGHT, padx=10, pady=10)
 
-    # Debug print to show the widget hierarchy
-    def print_widget_hierarchy(widget, indent=0):
-        print(" " * indent + str(widget))
-        for child in widget.winfo_children():
-            print_widget_hierarchy(child, indent + 2)
-
-    print_widget_hierarchy(root)
-
     root.mainloop()
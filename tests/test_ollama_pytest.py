@@ -1,7 +1,7 @@
 import os
 import sys
 import json
-from unittest.mock import patch, mock_open
+from unittest.mock import patch
 from typing import Any
 import pytest
 import tkinter as tk  # Import tkinter for GUI elements
@@ -35,53 +35,165 @@ def mock_parent_window(test_manifests: dict[str, Any]):
         pytest.fail("No models found, skipping UI tests.")
     return None  # Return None instead of creating a Tk window
 
-# --- Tests ---
-
-def test_list_models(test_manifests, manifest_paths, monkeypatch):
-    # Mock os.walk
-    mock_walk = []
-    for name, path in manifest_paths.items():
-        dir_path = os.path.dirname(path)
-        mock_walk.append((dir_path, [], [os.path.basename(path)]))
-
-    monkeypatch.setattr("ollama_model_manager.os.walk", lambda _: mock_walk)
-
-    # Test with mock files and data
-    with patch(
-        "ollama_model_manager.open",
-        mock_open(read_data=json.dumps(test_manifests["test_model1"])),
-    ) as m:
-        models = omm.list_models()
-        assert m.called
+@pytest.fixture
+def manifests_dir(tmp_path, monkeypatch):
+    """Point the module at an empty manifests/blobs tree under tmp_path."""
+    manifests = tmp_path / "manifests"
+    blobs = tmp_path / "blobs"
+    manifests.mkdir()
+    blobs.mkdir()
+    monkeypatch.setattr(omm, "MANIFESTS_DIR", str(manifests))
+    monkeypatch.setattr(omm, "BLOBS_DIR", str(blobs))
+    monkeypatch.setattr(omm, "_manifest_cache", {})
+    monkeypatch.setattr(omm, "blob_refcounts", omm.Counter())
+    return manifests
+
+def write_manifest(manifests_dir, rel_path, blobs=()):
+    path = manifests_dir.joinpath(*rel_path.split("/"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "config": {"digest": "sha256:0123456789abcdef"},
+        "layers": [{"size": 1024}],
+        "blobs": [{"sha256": b} for b in blobs],
+    }))
+    return path
+
+def make_model_info(file_path="", blob_hashes=()):
+    return omm.ModelInfo(
+        file_path=file_path,
+        blob_hashes=frozenset(blob_hashes),
+        id="",
+        size="",
+        modified="",
+        prefix="",
+        tag="",
+    )
 
-    # Ensure models are found before running UI tests
-    if not models:
-        pytest.fail("No models found, skipping UI tests.")
+# --- Tests ---
 
-    # Assertions for basic functionality (adapt as needed)
-    # You might want to check if the 'models' dictionary is populated correctly here
+def test_list_models(test_manifests, manifests_dir):
+    paths = [
+        write_manifest(manifests_dir, f"library/{name}/latest",
+                       blobs=[blob["sha256"] for blob in data["blobs"]])
+        for name, data in test_manifests.items()
+    ]
+
+    models = omm.list_models()
+    assert list(models) == [
+        "library/test_model1:latest",
+        "library/test_model2:latest",
+        "library/test_model_no_blobs:latest",
+    ]
+    assert {info.id for info in models.values()} == {"0123456789ab"}
+    assert models["library/test_model1:latest"].blob_hashes == {bytes.fromhex("aaaa"), bytes.fromhex("bbbb")}
+    assert models["library/test_model2:latest"].blob_hashes == {bytes.fromhex("bbbb"), bytes.fromhex("cccc")}
+    assert models["library/test_model_no_blobs:latest"].blob_hashes == frozenset()
 
     # Test with empty directory
-    monkeypatch.setattr(
-        "ollama_model_manager.os.walk", lambda _: []
-    )  # Mock an empty directory
-    assert (
-        omm.list_models() == {}
-    )  # Assert that an empty directory returns empty dictionary
+    for path in paths:
+        path.unlink()
+    assert omm.list_models() == {}  # Assert that an empty directory returns empty dictionary
+
+def test_list_models_tree(manifests_dir, monkeypatch):
+    latest = write_manifest(manifests_dir, "library/llama3/latest", blobs=["ab"])
+    nested = write_manifest(manifests_dir, "hf.co/user/model/q4", blobs=["cd"])
+    top = write_manifest(manifests_dir, "solo")
+    (manifests_dir / ".DS_Store").write_text("not json")
+    write_manifest(manifests_dir, ".partial/library/llama3/latest")
+
+    models = omm.list_models()
+    assert list(models) == ["hf.co/user/model:q4", "library/llama3:latest", "solo:latest"]
+    assert [(info.prefix, info.tag) for info in models.values()] == [
+        ("hf.co/user/model", "q4"), ("library/llama3", "latest"), ("solo", "latest"),
+    ]
+    assert models["library/llama3:latest"].file_path == str(latest)
+    assert set(omm._manifest_cache) == {str(latest), str(nested), str(top)}
+
+    # Unchanged manifests are served from the cache without starting the
+    # thread pool; deleted ones are evicted
+    cached_fields = omm._manifest_cache[str(latest)][2]
+    nested.unlink()
+    monkeypatch.setattr(omm, "ThreadPoolExecutor", lambda **_: pytest.fail("nothing to read"))
+    models = omm.list_models()
+    assert list(models) == ["library/llama3:latest", "solo:latest"]
+    assert set(omm._manifest_cache) == {str(latest), str(top)}
+    assert omm._manifest_cache[str(latest)][2] is cached_fields
+
+def test_list_models_skips_unreadable_dirs(manifests_dir, monkeypatch):
+    write_manifest(manifests_dir, "library/llama3/latest")
+    write_manifest(manifests_dir, "locked/model/v1")
+
+    real_scandir = os.scandir
+    def scandir(path):
+        if os.path.basename(path) == "locked":
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+    monkeypatch.setattr("ollama_model_manager.os.scandir", scandir)
+
+    assert list(omm.list_models()) == ["library/llama3:latest"]
+
+def test_list_models_skips_malformed_blob_digests(manifests_dir):
+    write_manifest(manifests_dir, "library/llama3/latest", blobs=["ab", "sha256:ee"])
+
+    models = omm.list_models()
+    assert models["library/llama3:latest"].blob_hashes == {bytes.fromhex("ab")}
+
+def test_uppercase_blob_digests_are_not_tracked(manifests_dir, monkeypatch, caplog):
+    blobs_dir = manifests_dir.parent / "blobs"
+    for h in ("AB", "cd"):
+        (blobs_dir / ("sha256-" + h)).write_text("blob")
+    write_manifest(manifests_dir, "library/llama3/latest", blobs=["AB", "cd"])
+    monkeypatch.setattr(omm, "refresh_model_list", MockRefresh())
+
+    models = omm.list_models()
+    assert models["library/llama3:latest"].blob_hashes == {bytes.fromhex("cd")}
+    assert "Skipping malformed blob digest 'AB'" in caplog.text
+
+    # The uppercase blob can't be matched to a rebuilt filename, so it is left alone
+    omm.delete_model("library/llama3:latest", models, None, suppress_messagebox=True)
+    assert sorted(os.listdir(blobs_dir)) == ["sha256-AB"]
+
+def test_list_models_handles_short_reads(manifests_dir, monkeypatch):
+    write_manifest(manifests_dir, "library/llama3/latest", blobs=["ab"])
+
+    real_read = os.read
+    monkeypatch.setattr("ollama_model_manager.os.read", lambda fd, size: real_read(fd, min(size, 7)))
+
+    models = omm.list_models()
+    assert models["library/llama3:latest"].blob_hashes == {bytes.fromhex("ab")}
+
+def test_format_size():
+    assert omm.format_size(0) == "0.0 B"
+    assert omm.format_size(1023) == "1023.0 B"
+    assert omm.format_size(1024) == "1.0 KB"
+    assert omm.format_size(1536 * 1024) == "1.5 MB"
+    assert omm.format_size(5 * 2**30) == "5.0 GB"
+    assert omm.format_size(3 * 2**50) == "3072.0 TB"
+    assert omm.format_size(1.5e9) == "1.4 GB"
+    assert omm.format_size(512.5) == "512.5 B"
+    assert omm.format_size(-5) == "-5.0 B"
 
 def test_find_all_references(monkeypatch):
+    hash1, hash2, hash3 = (bytes.fromhex(h) for h in ("aa11", "bb22", "cc33"))
     mock_model_data = {
-        "model1": {"blob_hashes": {"sha256-hash1", "sha256-hash2"}},
-        "model2": {"blob_hashes": {"sha256-hash2", "sha256-hash3"}},
+        "model1": make_model_info(blob_hashes={hash1, hash2}),
+        "model2": make_model_info(blob_hashes={hash2, hash3}),
     }
     monkeypatch.setattr(omm, "list_models", lambda: mock_model_data)
+    monkeypatch.delattr(omm, "models_cache", raising=False)
 
     expected_blob_refs = {
-        "sha256-hash1": {"model1"},
-        "sha256-hash2": {"model1", "model2"},
-        "sha256-hash3": {"model2"},
+        hash1: {"model1"},
+        hash2: {"model1", "model2"},
+        hash3: {"model2"},
     }
     assert omm.find_all_references() == expected_blob_refs
+    assert omm.find_all_references(mock_model_data) == expected_blob_refs
+
+    # Once the GUI has loaded models_cache, it is used instead of rescanning
+    monkeypatch.setattr(omm, "models_cache", {"model3": make_model_info(blob_hashes={hash3})}, raising=False)
+    monkeypatch.setattr(omm, "list_models", lambda: pytest.fail("list_models() should not be called"))
+    assert omm.find_all_references() == {hash3: {"model3"}}
 
 def test_delete_model(test_manifests, manifest_paths, mock_parent_window, monkeypatch):
     # Ensure models are found before running UI tests
@@ -90,24 +202,21 @@ def test_delete_model(test_manifests, manifest_paths, mock_parent_window, monkey
 
     model_name = "test_model1"
     models = {
-        model_name: {
-            "file_path": manifest_paths[model_name],
-            "blob_hashes": {"sha256-aaaa", "sha256-bbbb"},
-        }
+        model_name: make_model_info(
+            file_path=manifest_paths[model_name],
+            blob_hashes={bytes.fromhex("aaaa"), bytes.fromhex("bbbb")},
+        )
     }
 
-    # Mock messagebox, os.remove, os.walk, and refresh_model_list for testing
+    # Mock messagebox, os.remove, and refresh_model_list for testing
     mock_remove = MockRemove()
     monkeypatch.setattr("ollama_model_manager.os.remove", mock_remove)
     mock_refresh = MockRefresh()
     monkeypatch.setattr("ollama_model_manager.refresh_model_list", mock_refresh)
 
     # Test successful deletion
-    monkeypatch.setattr(
-        "ollama_model_manager.os.walk", lambda _: []
-    )  # Empty dir, no references
     with patch(
-        "ollama_model_manager.messagebox.showerror"
+        "tkinter.messagebox.showerror"
     ) as mock_showerror:  # Mock messagebox for error reporting
         omm.delete_model(model_name, models, mock_parent_window, suppress_messagebox=True)
         assert not mock_showerror.called
@@ -115,12 +224,31 @@ def test_delete_model(test_manifests, manifest_paths, mock_parent_window, monkey
         assert mock_refresh.called_with(mock_parent_window)
 
     # Test when model is not found
-    with patch("ollama_model_manager.messagebox.showerror") as mock_showerror:
+    with patch("tkinter.messagebox.showerror") as mock_showerror:
         omm.delete_model("non_existent_model", models, mock_parent_window, suppress_messagebox=True)
         mock_showerror.assert_called_once_with(
             "Error", "Model 'non_existent_model' not found."
         )
 
+def test_delete_model_keeps_shared_blobs(manifests_dir, monkeypatch):
+    blobs_dir = manifests_dir.parent / "blobs"
+    for h in ("ab", "cd", "ef"):
+        (blobs_dir / ("sha256-" + h)).write_text("blob")
+    write_manifest(manifests_dir, "library/a/latest", blobs=["ab", "cd"])
+    write_manifest(manifests_dir, "library/b/latest", blobs=["ab"])
+    monkeypatch.setattr(omm, "refresh_model_list", MockRefresh())
+
+    models = omm.list_models()
+    # A blob the counts have never seen must not be treated as unreferenced
+    models["library/a:latest"].blob_hashes |= {bytes.fromhex("ef")}
+    omm.delete_model("library/a:latest", models, None, suppress_messagebox=True)
+
+    assert sorted(os.listdir(blobs_dir)) == ["sha256-ab", "sha256-ef"]
+    assert list(models) == ["library/b:latest"]
+
+    omm.delete_model("library/b:latest", models, None, suppress_messagebox=True)
+    assert sorted(os.listdir(blobs_dir)) == ["sha256-ef"]
+
 def test_on_delete(monkeypatch):
     # Ensure models are found before running UI tests
     if not hasattr(omm, "models_cache"):
@@ -140,7 +268,7 @@ def test_on_delete(monkeypatch):
 
     # Test when no selection is made
     mock_listbox.curselection.return_value = ()
-    with patch("ollama_model_manager.messagebox.showwarning") as mock_showwarning:
+    with patch("tkinter.messagebox.showwarning") as mock_showwarning:
         omm.on_delete()
         mock_showwarning.assert_called_with(
             "No Selection", "Please select a model to delete."
@@ -152,7 +280,7 @@ def test_on_delete(monkeypatch):
         "test_model"  # Set the name of the model to be deleted
     )
     with patch(
-        "ollama_model_manager.messagebox.askyesno", return_value=False
+        "tkinter.messagebox.askyesno", return_value=False
     ) as mock_askyesno:  # Return False (Cancel)
         with patch(
             "ollama_model_manager.delete_model"
@@ -167,14 +295,14 @@ def test_on_delete(monkeypatch):
         "test_model"  # Set the name of the model to be deleted
     )
     with patch(
-        "ollama_model_manager.messagebox.askyesno", return_value=True
+        "tkinter.messagebox.askyesno", return_value=True
     ) as mock_askyesno:  # Return True (Confirm)
         with patch(
             "ollama_model_manager.delete_model"
         ) as mock_delete_model:  # Mock delete model function
             omm.on_delete()
             mock_delete_model.assert_called_once_with(
-                "test_model", mock_models_cache, mock_parent_window
+                "test_model", mock_models_cache, mock_parent_window, refresh=False
             )
 
 def test_required_dirs_exist():